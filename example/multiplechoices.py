@@ -2,7 +2,8 @@
 # Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
 
 from lemoneval.assembled.standard.multiplechoices import FiveChoicesFramework
-from lemoneval.backbone.session import Session
+from lemoneval.backbones.sessions import Session
+from lemoneval.utils.inputs import fast_input
 
 framework = FiveChoicesFramework(
     question="This is the question text",
@@ -21,7 +22,7 @@ print(public_data)
 json_str = session.to_json()
 
 # Obtain answer of choice
-choose = int(input("You choose: "))
+choose = int(fast_input("You choose: "))
 
 # Load session from JSON string
 new_session = Session.from_json(json_str)
@@ -29,7 +30,7 @@ print("session 03 =", new_session)
 
 # Submit the choosing
 try:
-    new_session.submit(dict(choose=choose))
+    new_session.submit(selected_choice=choose)
 except StopIteration:
     print("session 04 =", new_session)
 
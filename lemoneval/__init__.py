@@ -0,0 +1,38 @@
+# Lemoneval Project
+# Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
+"""Academic exercises structural configuration schemer.
+
+Commonly used names are re-exported at the package top-level but are imported
+lazily on first attribute access (PEP 562), so `import lemoneval` does not pay
+for submodules the caller never touches.
+"""
+
+# Maps each re-exported name to the submodule defining it
+_LAZY_IMPORTS = {
+    "BaseFramework": ".backbones.frameworks",
+    "Session": ".backbones.sessions",
+    "BaseParameter": ".backbones.parameters",
+    "Parameter": ".backbones.parameters",
+    "SequenceParameter": ".backbones.parameters",
+    "BaseValidator": ".backbones.validators",
+    "PredicateValidator": ".backbones.validators",
+}
+
+__all__ = tuple(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later accesses skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,9 +1,14 @@
 # Lemoneval Project
 # Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
 
+import random
+
 from ...backbones import frameworks, parameters
 from ...utils.dispatches import StateMachine
 
+# Pre-bound to skip the module attribute lookup per session creation
+_randint = random.randint
+
 class AddingNumbersFramework(frameworks.BaseFramework):
     """Simple algebra question: adding two integers which are uniformly
     randomized from within the given bound.
@@ -33,9 +38,8 @@ class AddingNumbersFramework(frameworks.BaseFramework):
 
     @StateMachine  # generate numbers
     def resume_session(self, session):
-        import random
-        session.a = random.randint(self.lower_bound, self.upper_bound)
-        session.b = random.randint(self.lower_bound, self.upper_bound)
+        session.a = _randint(self.lower_bound, self.upper_bound)
+        session.b = _randint(self.lower_bound, self.upper_bound)
         return "check_answer", { "a": session.a, "b": session.b }
 
     @resume_session.add_state(label="check_answer")  # check answer
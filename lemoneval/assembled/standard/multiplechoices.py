@@ -1,9 +1,20 @@
 # Lemoneval Project
 # Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
 
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ...backbones import frameworks, parameters
 from ...utils.dispatches import StageSequence
 
+# Interned status strings shared by every session report
+_CORRECT = sys.intern("correct")
+_INCORRECT = sys.intern("incorrect")
+
 class MultipleChoicesFramework(frameworks.BaseFramework):
     """Multiple choice question framework with one correct answer.
 
@@ -26,12 +37,30 @@ class MultipleChoicesFramework(frameworks.BaseFramework):
 
     def framework_validate(self):
         # Answer index must be within bounds
-        if not 0 <= self.answer < len(self.choices):
+        num_choices = len(self.choices)
+        if not 0 <= self.answer < num_choices:
             raise ValueError(
                 f"the index for correct answer must be between 0 and "
-                f"{len(self.choices)-1} but {self.answer!r} was given"
+                f"{num_choices - 1} but {self.answer!r} was given"
             )
 
+    def grade_batch(self, selected_choices):
+        """Grade a batch of selected choice indices in a single pass.
+
+        This is a shortcut for bulk grading which bypasses per-performer
+        session bookkeeping. It accepts a sequence of selected choice indices
+        (one per performer) and returns the list of obtained scores in the
+        same order. When numpy is installed and an ndarray is given, the
+        computation is vectorized and an ndarray is returned instead.
+        """
+        if numpy is not None and isinstance(selected_choices, numpy.ndarray):
+            return (selected_choices == self.answer) * self.score
+        answer = self.answer; score = self.score
+        return [
+            (selected_choice == answer) * score
+            for selected_choice in selected_choices
+        ]
+
     @StageSequence  # show question
     def resume_session(self, session):
         """Initiate the exercise interaction."""
@@ -46,7 +75,7 @@ class MultipleChoicesFramework(frameworks.BaseFramework):
         session.selected_choice = selected_choice
         is_correct = (session.selected_choice == self.answer)
         return True, {
-            "status": "correct" if is_correct else "incorrect",
+            "status": _CORRECT if is_correct else _INCORRECT,
             "score": is_correct * self.score
         }
 
@@ -5,7 +5,10 @@ be. Custom frameworks are expected to be derived from `BaseFramework`. See
 examples of custom frameworks in modules under `lemoneval.assembled`.
 """
 
-from inspect import getfullargspec, Signature, Parameter
+import sys
+from inspect import Signature, Parameter
+from .parameters import BaseParameter
+from .sessions import Session
 from ..utils.argdefault import EMPTY_DEFAULT
 
 
@@ -15,16 +18,17 @@ class _framework_builder(type):
     def __new__(typecls, clsname, bases, clsdict):
         cls = super().__new__(typecls, clsname, bases, clsdict)
         cls._extract_parameter_names(clsdict)
-        cls._make_signature()
+        cls._make_init(clsdict)
+        cls._make_repr(clsdict)
         return cls
 
     def _extract_parameter_names(cls, clsdict):
         """Create `parameter_names` from `clsdict` for framework class."""
         old_parameter_names = getattr(cls, "parameter_names", ())
+        old_names_set = frozenset(old_parameter_names)
         new_parameter_names = []
-        from .parameters import BaseParameter
         for name, descriptor in clsdict.items():
-            if name in old_parameter_names:
+            if name in old_names_set:
                 if not isinstance(descriptor, BaseParameter):
                     raise TypeError(
                         f"Parameter {name!r} overriden in derived class."
@@ -35,31 +39,94 @@ class _framework_builder(type):
                         f"parameter names should not begin with an underscore "
                         f"but the name {name!r} is used"
                     )
-                new_parameter_names.append(name)
+                new_parameter_names.append(sys.intern(name))
         cls.parameter_names = old_parameter_names + tuple(new_parameter_names)
 
+    @property
+    def __signature__(cls):
+        """Lazily-built `inspect.Signature` object for framework class.
+
+        Signature construction is slow relative to class creation, so it is
+        deferred until the first introspection and cached per class.
+        """
+        try:
+            return cls.__dict__["_cached_signature"]
+        except KeyError:
+            signature = cls._make_signature()
+            cls._cached_signature = signature
+            return signature
+
     def _make_signature(cls):
         """Create `inspect.Signature` object for framework class."""
         parameters = []
         for name in cls.parameter_names:
             parameter_object = getattr(cls, name)
             # Obtain default value
-            default = getattr(parameter_object, "default", EMPTY_DEFAULT)
-            default = (
-                default if default is not EMPTY_DEFAULT
-                else Parameter.empty
-            )
+            default = parameter_object.default
+            if default is EMPTY_DEFAULT:
+                default = Parameter.empty
             # Obtain annotation
-            annotation = getattr(parameter_object, "annotation", EMPTY_DEFAULT)
-            annotation = (
-                annotation if annotation is not EMPTY_DEFAULT
-                else Parameter.empty
-            )
+            annotation = parameter_object.annotation
+            if annotation is EMPTY_DEFAULT:
+                annotation = Parameter.empty
             parameters.append(Parameter(
                 name, Parameter.KEYWORD_ONLY,
                 default=default, annotation=annotation
             ))
-        cls.__signature__ = Signature(parameters)
+        return Signature(parameters)
+
+    def _make_init(cls, clsdict):
+        """Compile a specialized `__init__` for the framework class.
+
+        The generated constructor receives each declared parameter as a
+        keyword-only argument and assigns it to the corresponding descriptor
+        with inline statements, replacing the generic dict-lookup loop of
+        `_validate_and_set_parameters`. Validation semantics are unchanged
+        since the descriptors still perform all checks upon assignment.
+        """
+        if "__init__" in clsdict or not cls.parameter_names:
+            return
+        arguments = ", ".join(
+            f"{name}=EMPTY_DEFAULT" for name in cls.parameter_names
+        )
+        assignments = "\n".join(
+            f"    self.{name} = {name}" for name in cls.parameter_names
+        )
+        source = (
+            # Superfluous parameters are collected and silently ignored to
+            # match the behavior of `_validate_and_set_parameters`.
+            f"def __init__(self, *, {arguments}, **superfluous):\n"
+            f"{assignments}\n"
+            f"    self.framework_validate()\n"
+        )
+        namespace = { "EMPTY_DEFAULT": EMPTY_DEFAULT }
+        exec(source, namespace)
+        specialized_init = namespace["__init__"]
+        specialized_init.__qualname__ = f"{cls.__qualname__}.__init__"
+        specialized_init.__doc__ = cls.__init__.__doc__
+        cls.__init__ = specialized_init
+
+    def _make_repr(cls, clsdict):
+        """Compile a specialized `__repr__` for the framework class.
+
+        The generated method is a single f-string with the parameter names
+        baked in, replacing the generic loop over `parameter_names` with its
+        dynamic `getattr` per parameter.
+        """
+        if "__repr__" in clsdict or not cls.parameter_names:
+            return
+        parameters_text = ",\\n".join(
+            f"  {name}={{self.{name}!r}}" for name in cls.parameter_names
+        )
+        source = (
+            f"def __repr__(self):\n"
+            f"    return f\"{cls.__qualname__}(\\n{parameters_text}\\n)\"\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        specialized_repr = namespace["__repr__"]
+        specialized_repr.__qualname__ = f"{cls.__qualname__}.__repr__"
+        cls.__repr__ = specialized_repr
 
 
 class BaseFramework(object, metaclass=_framework_builder):
@@ -98,9 +165,9 @@ class BaseFramework(object, metaclass=_framework_builder):
 
         Superflous parameters are silently ignored.
         """
+        get = parameters.get
         for name in self.parameter_names:
-            value = parameters.get(name, EMPTY_DEFAULT)
-            setattr(self, name, value)
+            setattr(self, name, get(name, EMPTY_DEFAULT))
 
     def framework_validate(self):
         """Framework-level validation: to be overriden by subclasses.
@@ -120,7 +187,6 @@ class BaseFramework(object, metaclass=_framework_builder):
         When an exercise performer is attempting at the exercise, a session
         for this framework is created with this method.
         """
-        from .sessions import Session
         return Session(self)
 
     def __iter__(self):
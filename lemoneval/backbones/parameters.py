@@ -2,7 +2,10 @@
 # Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
 """Parameter classes for each attribute in exercise frameworks."""
 
+import sys
+from math import inf as INF
 from typing import Sequence
+from .validators import BaseValidator, PredicateValidator
 from ..utils.argdefault import EMPTY_DEFAULT
 
 
@@ -18,11 +21,17 @@ class BaseParameter(object):
 
     __slots__ = ("name",)
 
+    # Class-level fallbacks so signature building can read these attributes
+    # directly on descriptors lacking the corresponding mixins.
+    default = EMPTY_DEFAULT
+    annotation = EMPTY_DEFAULT
+
     def __init__(self, *, name=EMPTY_DEFAULT):
         self.name = name
 
     def __set_name__(self, owner, name):
-        self.name = self.name or name
+        # Interned so descriptor storage lookups hit the dict fast path
+        self.name = sys.intern(self.name or name)
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -30,11 +39,12 @@ class BaseParameter(object):
         return instance.__dict__[self.name]
 
     def __set__(self, instance, value):
-        if self.name in instance.__dict__:
+        instance_dict = instance.__dict__; name = self.name
+        if name in instance_dict:
             raise AttributeError("reassigning parameter is not allowed")
         if value is EMPTY_DEFAULT:
-            raise ValueError(f"missing parameter '{self.name}'")
-        instance.__dict__[self.name] = self.parameter_validate(value)
+            raise ValueError(f"missing parameter '{name}'")
+        instance_dict[name] = self.parameter_validate(value)
 
     def __delete__(self, instance):
         raise AttributeError("deleting parameter is not allowed")
@@ -60,6 +70,8 @@ class DataTypeMixin(BaseParameter):
         annotation: Annotation for parameter values to be used in signatures.
     """
 
+    __slots__ = ()
+
     def __init__(self, *, dtype=EMPTY_DEFAULT, annotation=EMPTY_DEFAULT,
                     **kwargs):
         super().__init__(**kwargs)
@@ -69,15 +81,22 @@ class DataTypeMixin(BaseParameter):
             raise TypeError("invalid dtype specified")
         self.dtype = dtype
         self.annotation = annotation
+        # Precomputed per descriptor so check_dtype avoids a hasattr probe
+        # on every assignment
+        self._has_dtype = dtype is not EMPTY_DEFAULT
+        # Display name of the data type, precomputed for error messages
+        self._dtype_name = getattr(dtype, "__qualname__", dtype)
 
     def check_dtype(self, value, raise_error=True):
         """Check the data type of the given value."""
-        if hasattr(self, "dtype") and not isinstance(value, self.dtype):
-            dtype = getattr(self.dtype, "__qualname__", self.dtype)
+        if type(value) is self.dtype:
+            # Exact-type fast path; isinstance below still accepts subclasses
+            return True
+        if self._has_dtype and not isinstance(value, self.dtype):
             if raise_error:
                 raise TypeError(
-                    f"expecting value type '{dtype}' for '{self.name}' but "
-                    f"{value!r} is given"
+                    f"expecting value type '{self._dtype_name}' for "
+                    f"'{self.name}' but {value!r} is given"
                 )
             return False
         return True
@@ -86,6 +105,8 @@ class DataTypeMixin(BaseParameter):
 class DefaultValueMixin(BaseParameter):
     """Parameter mixin class for parameter default values."""
 
+    __slots__ = ()
+
     def __init__(self, *, default=EMPTY_DEFAULT, **kwargs):
         super().__init__(**kwargs)
         self.default = default
@@ -99,9 +120,12 @@ class DefaultValueMixin(BaseParameter):
 class ValidatorMixin(BaseParameter):
     """Parameter mixin class to add parameter validation support."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.validators = []
+        self.validators = ()
+        self._fused_validator = None
 
     def add_validators(self, *validators):
         """Attach a sequence of validators to the parameter. Each validator
@@ -113,17 +137,45 @@ class ValidatorMixin(BaseParameter):
         the validator, then it should return True. Otherwise, it should either
         return False or raise an exception describing what went wrong.
         """
-        from .validators import BaseValidator, PredicateValidator
+        accepted = []; append = accepted.append
         for validator in validators:
             if isinstance(validator, BaseValidator):
-                self.validators.append(validator)
+                append(validator)
             elif callable(validator):
-                self.validators.append(PredicateValidator(validator))
+                append(PredicateValidator(validator))
             else:
                 alien = getattr(validator, "__qualname__", validator)
                 raise TypeError(
                     f"expected a validator but {alien} was given"
                 )
+        self.validators += tuple(accepted)
+        self._compile_fused_validator()
+
+    def _compile_fused_validator(self):
+        """Compose all attached validators into one compiled callable so that
+        each parameter assignment makes a single call instead of looping over
+        the validator list. A lone validator is bound directly without any
+        wrapper."""
+        if not self.validators:
+            self._fused_validator = None
+            return
+        if len(self.validators) == 1:
+            self._fused_validator = self.validators[0]
+            return
+        namespace = {
+            f"validator_{index}": validator
+            for index, validator in enumerate(self.validators)
+        }
+        conjunction = " and ".join(
+            f"validator_{index}(value, target)"
+            for index in range(len(self.validators))
+        )
+        source = (
+            f"def fused_validator(value, target):\n"
+            f"    return {conjunction}\n"
+        )
+        exec(source, namespace)
+        self._fused_validator = namespace["fused_validator"]
 
     def add_validator(self, validator):
         """This method is the same as add_validators except that only one
@@ -138,31 +190,46 @@ class ValidatorMixin(BaseParameter):
 
     def check_with_validators(self, value, raise_error=True):
         """Run validators against the given value."""
-        for validator in self.validators:
-            if not validator(value, self.name):
-                if raise_error:
-                    raise ValueError(
-                        f"the given value {value!r} failed the validation "
-                        f"for '{self.name}'"
-                    )
-                return False
-        return True
+        if self._fused_validator is None:
+            return True
+        if self._fused_validator(value, self.name):
+            return True
+        if raise_error:
+            raise ValueError(
+                f"the given value {value!r} failed the validation "
+                f"for '{self.name}'"
+            )
+        return False
 
 
 class Parameter(ValidatorMixin, DefaultValueMixin,
                 DataTypeMixin, BaseParameter):
     """Single-value parameter descriptor for exercise framework."""
 
+    # Slot storage for all attributes introduced by the mixin classes; the
+    # mixins themselves declare empty `__slots__` to avoid layout conflicts.
+    __slots__ = ("dtype", "annotation", "_has_dtype", "_dtype_name",
+                 "default", "validators", "_fused_validator")
+
     def __init__(self, *, name=EMPTY_DEFAULT, dtype=EMPTY_DEFAULT,
                     default=EMPTY_DEFAULT):
         super().__init__(name=name, dtype=dtype, default=default)
 
     def parameter_validate(self, value):
-        self.check_dtype(value)
-        self.check_with_validators(value)
+        # Exact-type match and absent validators skip the checking calls
+        # entirely; anything else takes the full path.
+        if type(value) is not self.dtype:
+            self.check_dtype(value)
+        if self._fused_validator is not None:
+            self.check_with_validators(value)
         return value
 
 
+# Memoized results of `SequenceParameter._resolve_lengths` for hashable
+# length specifications, shared across all descriptor instances.
+_resolved_length_cache = {}
+
+
 class SequenceParameter(ValidatorMixin, DefaultValueMixin,
                         DataTypeMixin, BaseParameter):
     """Sequence of parameters descriptor for exercise framework.
@@ -180,7 +247,10 @@ class SequenceParameter(ValidatorMixin, DefaultValueMixin,
     integer is missing, then there is no upper bound limit.
     """
 
-    __slots__ = ("lb_length", "ub_length")
+    __slots__ = (
+        "dtype", "annotation", "_has_dtype", "_dtype_name", "default",
+        "validators", "_fused_validator", "lb_length", "ub_length",
+    )
 
     def __init__(self, *, name=EMPTY_DEFAULT, dtype=EMPTY_DEFAULT,
                     default=EMPTY_DEFAULT, length=(0,)):
@@ -188,20 +258,45 @@ class SequenceParameter(ValidatorMixin, DefaultValueMixin,
         super().__init__(
             name=name, dtype=dtype, annotation=annotation, default=default
         )
-        self.lb_length, self.ub_length = self._resolve_lengths(length)
+        try:
+            bounds = _resolved_length_cache[length]
+        except KeyError:
+            bounds = _resolved_length_cache[length] \
+                = self._resolve_lengths(length)
+        except TypeError:  # unhashable length specification
+            bounds = self._resolve_lengths(length)
+        self.lb_length, self.ub_length = bounds
 
     def parameter_validate(self, values):
         length, values = self.sanitize_values(values)
         self.check_sequence_length(length)
-        for index, value in enumerate(values):
+        dtype = self.dtype; validators = self.validators
+        # Fast path: when there are no validators, a single C-level scan
+        # checks the type of every element at once. The per-element loop is
+        # entered only to pinpoint a failing element in the error message or
+        # to run validators.
+        if (validators or not isinstance(dtype, type)
+                or not all(map(dtype.__instancecheck__, values))):
+            index = 0
             try:
-                self.check_dtype(value)
-                self.check_with_validators(value)
+                # Single exception frame around the loop; `index` tracks the
+                # failing element for the error message.
+                for index, value in enumerate(values):
+                    self.check_dtype(value)
+                    self.check_with_validators(value)
             except Exception as e:
                 raise ValueError(
                     f"error for value at index {index} of parameter "
                     f"sequence '{self.name}'"
                 ) from e
+        if self.dtype is str:
+            # Intern string elements so that equal values across framework
+            # instances share storage and compare by identity first. Only
+            # exact str instances are eligible; sys.intern rejects subclasses.
+            values = tuple(
+                sys.intern(value) if type(value) is str else value
+                for value in values
+            )
         return values
 
     @staticmethod
@@ -214,7 +309,6 @@ class SequenceParameter(ValidatorMixin, DefaultValueMixin,
         the lower bound and the upper bound limit on the sequence length,
         respectively. If the second integer is missing, then there is no upper
         bound limit."""
-        from math import inf as INF
         if isinstance(length, int):
             if length < 0:
                 raise ValueError(
@@ -258,7 +352,8 @@ class SequenceParameter(ValidatorMixin, DefaultValueMixin,
         the container and convert it to a tuple sequence."""
         try:
             length = len(values)  # make sure it is finitely countable
-            values = tuple(values)  # works if iterable
+            if type(values) is not tuple:
+                values = tuple(values)  # works if iterable
         except TypeError as e:
             raise TypeError(
                 f"the values for '{self.name}' must be an iterable of finite "
@@ -269,18 +364,22 @@ class SequenceParameter(ValidatorMixin, DefaultValueMixin,
     def check_sequence_length(self, length):
         """Check if the length of the tuples is within the bounds."""
         if not self.lb_length <= length <= self.ub_length:
-            if self.lb_length == self.ub_length:
-                raise ValueError(
-                    f"expecting '{self.name}' of length {self.lb_length} but "
-                    f"one of length {length} was given"
-                )
-            import math
-            if self.ub_length == math.inf:
-                raise ValueError(
-                    f"expecting '{self.name}' of length at least "
-                    f"{self.lb_length} but one of length {length} was given"
-                )
+            self._raise_length_error(length)
+
+    def _raise_length_error(self, length):
+        """Cold path: raise the error describing the length bound violation
+        detected by check_sequence_length."""
+        if self.lb_length == self.ub_length:
             raise ValueError(
-                f"expecting '{self.name}' of length between {self.lb_length} "
-                f"and {self.ub_length} but one of length {length} was given"
+                f"expecting '{self.name}' of length {self.lb_length} but "
+                f"one of length {length} was given"
             )
+        if self.ub_length == INF:
+            raise ValueError(
+                f"expecting '{self.name}' of length at least "
+                f"{self.lb_length} but one of length {length} was given"
+            )
+        raise ValueError(
+            f"expecting '{self.name}' of length between {self.lb_length} "
+            f"and {self.ub_length} but one of length {length} was given"
+        )
@@ -13,8 +13,10 @@ Interactions with session objects depends on different types of frameworks
 and is described by the method `framework.resume_session`.
 """
 
+import pickle
 from functools import partial, update_wrapper, WRAPPER_ASSIGNMENTS
 from types import MethodType
+from ..utils import json as json_util
 from ..utils.decorators import CallableWrapper
 from ..utils.docstrings import trim
 
@@ -23,13 +25,33 @@ class _resumable_method(CallableWrapper):
     """Every time `session.wrapped` method binding occurs, update
     documentation attributes on the method.
     """
+    def init_hook(self):
+        super().init_hook()
+        # Wrapper attributes keyed by the resume function they describe;
+        # repeat bindings to the same phase skip the wrapper update entirely.
+        self._attr_cache = {}
+
     def bind_hook(self, session, session_cls):
         resume_func = session._framework.resume_session
         if hasattr(resume_func, "get_current_phase"):
             resume_func = resume_func.get_current_phase(session)
+        try:
+            cached_attrs = self._attr_cache[resume_func]
+        except KeyError:
+            pass
+        else:
+            for attr, value in cached_attrs:
+                setattr(self, attr, value)
+            return
         resume_method = MethodType(resume_func, session)
         update_wrapper(self, resume_method, updated=())
-        self.__doc__ = f"{trim(self.__doc__)}\n\n{trim(self._func.__doc__)}"
+        self.__doc__ = (
+            f"{trim(self.__doc__)}\n\n{trim(self._func.__doc__)}"
+        )
+        self._attr_cache[resume_func] = tuple(
+            (attr, getattr(self, attr))
+            for attr in WRAPPER_ASSIGNMENTS if hasattr(self, attr)
+        )
 
 
 class Session(object):
@@ -40,19 +62,36 @@ class Session(object):
     instance object.
     """
 
+    # Instance attributes which must never be serialized: they are either
+    # supplied separately (`_framework` goes through `serialized_args`) or
+    # rebuilt from the framework upon deserialization.
+    _unserialized_fields = frozenset(("_framework", "_resume_method"))
+
     def __init__(self, framework):
         self._framework = framework
-        self._clear_prepared()  # initialize prepared response attributes
+        # Bind `framework.resume_session` once; each step of the session
+        # reuses the binding instead of re-descriptor-binding per call
+        self._resume_method = framework.resume_session
+        self._started = False
+        self._finished = False
+        # Responses to be delivered to `framework.resume_session`
+        self._prepared_args = ()
+        self._prepared_kwargs = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_resume_method"]  # bound method; rebuilt in __setstate__
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._resume_method = self._framework.resume_session
 
     def __repr__(self):
-        formatted_dict_items = (
-            (name, repr(value).replace("\n", "\n  "))
+        formatted_dict_text = ",\n".join([
+            "  {}={}".format(name, repr(value).replace("\n", "\n  "))
             for name, value in self.__dict__.items()
-        )
-        formatted_dict_text = ",\n".join(
-            f"  {name}={value}"
-            for name, value in formatted_dict_items
-        )
+        ])
         return f"{type(self).__qualname__}(\n{formatted_dict_text}\n)"
 
     def __iter__(self):
@@ -67,9 +106,12 @@ class Session(object):
 
     @property
     def serialized_dict(self):
-        copied_dict = self.__dict__.copy()  # type: dict
-        copied_dict.pop("_framework")
-        return copied_dict
+        unserialized = self._unserialized_fields
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in unserialized
+        }
 
     def _resume(self):
         """Obtain and pass along prepared responses (`_prepared_args` and
@@ -79,22 +121,28 @@ class Session(object):
         if self.has_finished:
             raise StopIteration(self._summary)
         try:
-            self._public = self._framework.resume_session(
+            self._public = self._resume_method(
                 self, *self._prepared_args, **self._prepared_kwargs
             )
+            self._started = True
             return self._public
         except StopIteration as e:
             self._public = e.value
             self._summary = e.value
+            self._started = True
+            self._finished = True
             raise
         finally:
             self._clear_prepared()  # reset prepared responses
 
     def _clear_prepared(self):
         """Clear prepared responses."""
-        # Responses to be delivered to `framework.resume_session`
-        self._prepared_args = ()
-        self._prepared_kwargs = {}
+        # Replace only when responses were actually prepared; the common
+        # bare `__next__` step leaves the empty containers untouched.
+        if self._prepared_args:
+            self._prepared_args = ()
+        if self._prepared_kwargs:
+            self._prepared_kwargs = {}
 
     @_resumable_method
     def prepare(self, *args, **kwargs):
@@ -123,12 +171,12 @@ class Session(object):
         """Boolean indicating whether the session has started with at least
         one iteration (i.e. at least one call to `__next__` or `submit`).
         """
-        return hasattr(self, "_public")
+        return self._started
 
     @property
     def has_finished(self):
         """Boolean indicating whether the session has ended."""
-        return hasattr(self, "_summary")
+        return self._finished
 
     @property
     def public_data(self):
@@ -152,8 +200,44 @@ class Session(object):
         """Serialize the session into JSON string (and additionally write to
         a file if file pointer `fp` is provided)."""
         if fp is not None:
-            from ..utils.json import dump as write_json_file
-            write_json_file(self, fp)
+            json_util.dump(self, fp)
         if string_return:
-            from ..utils.json import dumps as get_json_str
-            return get_json_str(self)
+            return json_util.dumps(self)
+
+    def to_bytes(self):
+        """Serialize the session into a compact binary string.
+
+        This path is faster and smaller than `to_json` and is meant for
+        persisting large numbers of sessions; `to_json` remains the
+        human-readable export.
+        """
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialize a session back from the binary string produced by the
+        method `to_bytes`.
+
+        Warning:
+            This uses the pickle module underneath; only load data obtained
+            from a trusted source.
+        """
+        session = pickle.loads(data)
+        if not isinstance(session, cls):
+            raise TypeError(
+                f"expecting a serialized {cls.__qualname__} object in the "
+                f"binary string"
+            )
+        return session
+
+    @classmethod
+    def from_json(cls, jsontxt):
+        """Deserialize a session back from the JSON string produced by the
+        method `to_json`."""
+        session = json_util.loads(jsontxt)
+        if not isinstance(session, cls):
+            raise TypeError(
+                f"expecting a serialized {cls.__qualname__} object in the "
+                f"JSON string"
+            )
+        return session
@@ -5,6 +5,8 @@
 class ArgumentDefault():
     """Object to represent empty argument default which evaluates to False."""
 
+    __slots__ = ()
+
     def __bool__(self):
         return False
 
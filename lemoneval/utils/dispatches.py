@@ -93,11 +93,19 @@ class StageSequence(object):
         """Obtain current stage method based on given session. This method
         also zero-initialize `session._stage_counter` if not already exists.
         """
-        session._stage_counter = getattr(session, "_stage_counter", 0)
+        methods = self._methods
+        if type(methods) is list:
+            # Freeze the stage list into a tuple upon first dispatch;
+            # add_stage only runs while the class body is being executed.
+            methods = self._methods = tuple(methods)
         try:
-            stage_method = self._methods[session._stage_counter]
+            counter = session._stage_counter
+        except AttributeError:
+            counter = session._stage_counter = 0
+        try:
+            stage_method = methods[counter]
         except IndexError as e:
-            if session._stage_counter == len(self._methods):
+            if counter == len(methods):
                 raise AttributeError("no more callable stages") from e
             raise
         return stage_method
@@ -207,11 +215,14 @@ class StateMachine(object):
         """Obtain current state method based on given session. This method
         also zero-initialize `session._state_label` if not already exists.
         """
-        session._state_label = getattr(session, "_state_label", "$start")
         try:
-            state_method = self._methods[session._state_label]
+            label = session._state_label
+        except AttributeError:
+            label = session._state_label = "$start"
+        try:
+            state_method = self._methods[label]
         except KeyError as e:
-            if session._state_label == "$end":
+            if label == "$end":
                 raise AttributeError("no more callable state") from e
             raise
         return state_method
@@ -0,0 +1,23 @@
+# Lemoneval Project
+# Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
+"""Console input helper functions."""
+
+import sys
+
+
+def fast_input(prompt=""):
+    """Read one line of input from standard input.
+
+    This behaves like the built-in `input` on an interactive terminal. When
+    standard input is redirected (such as answers piped in during batch
+    runs), it reads whole lines from the underlying binary buffer instead of
+    going through the character-oriented `input` machinery.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    if prompt:
+        print(prompt, end="", flush=True)
+    line = sys.stdin.buffer.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.decode().rstrip("\r\n")
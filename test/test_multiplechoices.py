@@ -2,6 +2,7 @@
 # Lemoneval Project
 # Author: Abhabongse Janthong <6845502+abhabongse@users.noreply.github.com>
 
+import pickle
 import unittest
 from lemoneval.assembled.standard.multiplechoices import FiveChoicesFramework
 from lemoneval.backbones.sessions import Session
@@ -95,3 +96,44 @@ class Phase_AfterSessionCreation(unittest.TestCase):
     def test_json_reciprocity(self):
         self.assertFalse(new_session.has_started)
         self.assertFalse(new_session.has_finished)
+
+#####################################################
+##  Unit tests: Binary Serialization of a Session  ##
+#####################################################
+
+class Phase_BinarySerialization(unittest.TestCase):
+
+    def test_bytes_reciprocity_midsession(self):
+        mid_session = framework.create_session()
+        mid_session.submit()
+        restored = Session.from_bytes(mid_session.to_bytes())
+        self.assertTrue(restored.has_started)
+        self.assertFalse(restored.has_finished)
+        with self.assertRaises(StopIteration) as context:
+            restored.submit(selected_choice=0)
+        self.assertEqual(context.exception.value["score"], 10)
+
+    def test_bytes_reciprocity_finished(self):
+        finished_session = framework.create_session()
+        finished_session.submit()
+        with self.assertRaises(StopIteration):
+            finished_session.submit(selected_choice=3)
+        restored = Session.from_bytes(finished_session.to_bytes())
+        self.assertTrue(restored.has_finished)
+        self.assertEqual(restored.summary_data["score"], 0)
+
+    def test_wrong_type_rejection(self):
+        with self.assertRaisesRegex(TypeError, r"serialized Session"):
+            Session.from_bytes(pickle.dumps(("not", "a", "session")))
+        with self.assertRaisesRegex(TypeError, r"serialized Session"):
+            Session.from_json('["not", "a", "session"]')
+
+###################################
+##  Unit tests: Batched Grading  ##
+###################################
+
+class Phase_BatchGrading(unittest.TestCase):
+
+    def test_grade_batch_with_list(self):
+        scores = framework.grade_batch([0, 1, 2, 0, 4])
+        self.assertEqual(scores, [10, 0, 0, 10, 0])